@@ -0,0 +1,91 @@
+import numpy as np
+from numba import njit
+from typing import Tuple
+
+@njit(cache=True)
+def _calibration_kernel(x_t: np.ndarray, y_t: np.ndarray, n_bins: int):
+    """Single-pass ECE, Brier and per-bin statistics over uniform [0, 1] bins."""
+    n = x_t.shape[0]
+    sum_x = np.zeros(n_bins)
+    sum_y = np.zeros(n_bins)
+    counts = np.zeros(n_bins, dtype=np.int64)
+    brier = 0.0
+    k = 0
+    
+    for i in range(n):
+        # Outcomes may be int8; accumulate in float64
+        x = np.float64(x_t[i])
+        y = np.float64(y_t[i])
+        # Leave NaN/inf predictions out of every bin, as np.digitize did
+        if not np.isfinite(x):
+            continue
+        k += 1
+        # Uniform bins: clamp into [0, 1] and bucket with floor(x * n_bins)
+        b = min(int(min(max(x, 0.0), 1.0) * n_bins), n_bins - 1)
+        sum_x[b] += x
+        sum_y[b] += y
+        counts[b] += 1
+        # Welford running mean of the squared error
+        brier += ((x - y) ** 2 - brier) / k
+    
+    # Keep only non-empty bins
+    valid = counts > 0
+    bin_counts = counts[valid]
+    bin_centers = sum_x[valid] / bin_counts
+    empirical_freqs = sum_y[valid] / bin_counts
+    
+    # No finite predictions: report NaN rather than a perfect-looking 0.0
+    if k == 0:
+        return np.nan, np.nan, bin_centers, empirical_freqs, bin_counts
+    
+    ece = np.sum(np.abs(empirical_freqs - bin_centers) * (bin_counts / k))
+    
+    return ece, brier, bin_centers, empirical_freqs, bin_counts
+
+def compute_calibration_metrics(x_t: np.ndarray, y_t: np.ndarray, n_bins: int = 10) -> Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute ECE and Brier score, and prepare data for reliability diagram."""
+    return _calibration_kernel(np.asarray(x_t), np.asarray(y_t), n_bins)
+
+# Reliability diagram figure, created on first plot and reused for later ones
+_FIG = None
+_AX = None
+
+def plot_reliability_diagram(bin_centers: np.ndarray, empirical_freqs: np.ndarray, bin_counts: np.ndarray, ece: float, brier: float, output_path: str):
+    """Plot the reliability diagram with calibration metrics."""
+    global _FIG, _AX
+    if _FIG is None:
+        # Import lazily so metric-only callers skip matplotlib entirely. A bare Figure
+        # stays out of pyplot's figure manager and leaves the process backend alone
+        from matplotlib.figure import Figure
+        _FIG = Figure(figsize=(10, 8))
+        _AX = _FIG.subplots()
+    ax = _AX
+    ax.clear()
+    
+    # Plot diagonal (perfect calibration)
+    ax.plot([0, 1], [0, 1], 'k--', label='Perfect calibration')
+    
+    # Plot calibration points
+    ax.scatter(bin_centers, empirical_freqs, c='blue', s=100, label='Calibration points')
+    
+    # Add error bars (binomial confidence intervals)
+    # bin_counts only holds non-empty bins, so no zero-count guard is needed
+    p = empirical_freqs
+    ci = 1.96 * np.sqrt(p * (1-p) / bin_counts)  # 95% confidence interval
+    ax.errorbar(bin_centers, empirical_freqs, yerr=ci, fmt='none', color='blue', alpha=0.3)
+    
+    # Add labels and title
+    ax.set_xlabel('Predicted Probability (Market Price)', fontsize=12)
+    ax.set_ylabel('Empirical Frequency (Actual Outcomes)', fontsize=12)
+    ax.set_title(f'Market Reliability Diagram\nECE = {ece:.3f}, Brier = {brier:.3f}', fontsize=14)
+    ax.legend(fontsize=12)
+    ax.grid(True, alpha=0.3)
+    
+    # Set axis limits and ticks
+    ax.set_xlim(-0.05, 1.05)
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_xticks(np.linspace(0, 1, 11))
+    ax.set_yticks(np.linspace(0, 1, 11))
+    
+    # Save plot; the figure is kept open for the next call
+    _FIG.savefig(output_path, dpi=300, bbox_inches='tight')
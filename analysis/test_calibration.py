@@ -0,0 +1,49 @@
+import os
+import numpy as np
+import orjson
+from calibration import compute_calibration_metrics
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+def test_fixed_input():
+    # Values on bin edges (0.6, 0.7, 1.0) pin down the floor(x * n_bins) bucketing
+    x_t = np.array([0.05, 0.3, 0.5, 0.6, 0.7, 0.7, 0.9, 1.0])
+    y_t = np.array([0, 0, 1, 1, 1, 0, 1, 1], dtype=np.int8)
+
+    ece, brier, bin_centers, empirical_freqs, bin_counts = compute_calibration_metrics(x_t, y_t)
+
+    np.testing.assert_array_equal(bin_counts, [1, 1, 1, 1, 2, 2])
+    np.testing.assert_allclose(bin_centers, [0.05, 0.3, 0.5, 0.6, 0.7, 0.95])
+    np.testing.assert_allclose(empirical_freqs, [0.0, 0.0, 1.0, 1.0, 0.5, 1.0])
+    assert np.isclose(ece, 0.21875)
+    assert np.isclose(brier, np.mean((x_t - y_t) ** 2))
+
+def test_no_finite_predictions():
+    # Empty and all-NaN/inf input must not read as perfect calibration
+    for x_t in (np.array([]), np.array([np.nan, np.inf, -np.inf])):
+        y_t = np.zeros(len(x_t), dtype=np.int8)
+
+        ece, brier, bin_centers, empirical_freqs, bin_counts = compute_calibration_metrics(x_t, y_t)
+
+        assert np.isnan(ece)
+        assert np.isnan(brier)
+        assert len(bin_centers) == len(empirical_freqs) == len(bin_counts) == 0
+
+def test_final_probs():
+    with open(os.path.join(DATA_DIR, 'final_probs.json'), 'rb') as f:
+        data = orjson.loads(f.read())
+    x_t = np.array([entry['p_final'] for entry in data])
+    y_t = np.array([entry['outcome'] == '1' for entry in data], dtype=np.int8)
+
+    ece, brier, bin_centers, empirical_freqs, bin_counts = compute_calibration_metrics(x_t, y_t)
+
+    np.testing.assert_array_equal(bin_counts, [1, 1, 3, 15, 10, 14, 6])
+    np.testing.assert_allclose(bin_centers, [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.91666667])
+    assert np.isclose(ece, 0.29)
+    assert np.isclose(brier, 0.0982)
+
+if __name__ == "__main__":
+    test_fixed_input()
+    test_no_finite_predictions()
+    test_final_probs()
+    print("Calibration checks passed")
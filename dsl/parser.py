@@ -1,28 +1,19 @@
+import copy
+import re
+from functools import lru_cache
+
 from lark import Lark, Transformer
 
-# Define the grammar
-grammar = """
-    start: market
-    
-    market: "market" string "{" fields "}"
-    
-    fields: outcomes
-          oracle
-          fee
-          trading_mechanism
-    
-    outcomes: "outcomes:" "Yes" "," "No" ";"
-    oracle: "oracle:" address ";"
-    fee: "fee:" number "%" ";"
-    trading_mechanism: "trading_mechanism:" "pool" ";"
-    
-    string: /"[^"]*"/
-    address: /0x[0-9a-fA-F]{40}/
-    number: /[0-9]+/
-    
-    %import common.WS
-    %ignore WS
-"""
+# Regex for the fixed market layout in grammar.lark; anything it rejects falls back to Lark.
+# Whitespace is [ \t\f\r\n] to match the grammar's common.WS, not the wider Unicode \s
+_MARKET_RE = re.compile(
+    r'[ \t\f\r\n]*market[ \t\f\r\n]*"(?P<question>[^"]*)"[ \t\f\r\n]*\{'
+    r'[ \t\f\r\n]*outcomes:[ \t\f\r\n]*Yes[ \t\f\r\n]*,[ \t\f\r\n]*No[ \t\f\r\n]*;'
+    r'[ \t\f\r\n]*oracle:[ \t\f\r\n]*(?P<oracle>0x[0-9a-fA-F]{40})[ \t\f\r\n]*;'
+    r'[ \t\f\r\n]*fee:[ \t\f\r\n]*(?P<fee>[0-9]+)[ \t\f\r\n]*%[ \t\f\r\n]*;'
+    r'[ \t\f\r\n]*trading_mechanism:[ \t\f\r\n]*pool[ \t\f\r\n]*;'
+    r'[ \t\f\r\n]*\}[ \t\f\r\n]*'
+)
 
 # Create a transformer to convert the parse tree to a dictionary
 class MarketTransformer(Transformer):
@@ -62,9 +53,28 @@ class MarketTransformer(Transformer):
     def number(self, items):
         return items[0]
 
+# Build the LALR parser once, on the first input the regex cannot handle
+@lru_cache(maxsize=None)
+def _lark_parser():
+    return Lark.open('grammar.lark', rel_to=__file__, parser='lalr', transformer=MarketTransformer())
+
+@lru_cache(maxsize=256)
+def _parse_with_lark(text):
+    return _lark_parser().parse(text)
+
 def parse_market(text):
-    parser = Lark.open('market_grammar.lark', parser='lalr', transformer=MarketTransformer())
-    return parser.parse(text)
+    m = _MARKET_RE.fullmatch(text)
+    if m is None:
+        # Let Lark parse extended input or raise a proper syntax error;
+        # copy the cached result so callers can mutate it safely
+        return copy.deepcopy(_parse_with_lark(text))
+    return {
+        "question": m['question'],
+        "outcomes": ["Yes", "No"],
+        "oracle": m['oracle'],
+        "fee": int(m['fee']),
+        "mechanism": "pool"
+    }
 
 # Example usage
 if __name__ == "__main__":
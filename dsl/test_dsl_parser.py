@@ -0,0 +1,38 @@
+import os
+from lark.exceptions import UnexpectedInput
+from parser import parse_market, _lark_parser
+
+DSL_DIR = os.path.dirname(os.path.abspath(__file__))
+ORACLE = '0x1234567890123456789012345678901234567890'
+
+def _markets():
+    with open(os.path.join(DSL_DIR, 'example.dsl'), 'r') as f:
+        yield f.read()
+    # Compact: no optional whitespace at all
+    yield f'market"Q"{{outcomes:Yes,No;oracle:{ORACLE};fee:2%;trading_mechanism:pool;}}'
+    # Every whitespace character the grammar ignores
+    yield f'\r\n\tmarket \f"Q 2"\t{{\r\n outcomes: Yes ,\tNo ;\n oracle:\f{ORACLE} ;\n fee: 15 % ;\n trading_mechanism:pool;\n}}\n'
+
+def test_regex_matches_grammar():
+    for text in _markets():
+        assert parse_market(text) == _lark_parser().parse(text)
+
+def test_rejected_input_raises():
+    rejected = [
+        'market "x" { bogus }',
+        # Unicode whitespace that \s would accept but common.WS does not
+        f'market "x"\v{{outcomes: Yes, No; oracle: {ORACLE}; fee: 1%; trading_mechanism: pool;}}',
+        f'market "x"\xa0{{outcomes: Yes, No; oracle: {ORACLE}; fee: 1%; trading_mechanism: pool;}}',
+        f'market "x"\u2003{{outcomes: Yes, No; oracle: {ORACLE}; fee: 1%; trading_mechanism: pool;}}',
+    ]
+    for text in rejected:
+        try:
+            parse_market(text)
+        except UnexpectedInput:
+            continue
+        raise AssertionError(f"parse_market accepted {text!r}")
+
+if __name__ == "__main__":
+    test_regex_matches_grammar()
+    test_rejected_input_raises()
+    print("Parser checks passed")
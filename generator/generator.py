@@ -1,24 +1,9 @@
-def generate_contract(market: dict) -> str:
-    """Generate a Solidity contract from a market dictionary.
-    
-    Args:
-        market: Dictionary containing market details with keys:
-            - question: str
-            - oracle: str (Ethereum address)
-            - fee: int (basis points)
-            - outcomes: list[str]
-            - mechanism: str
-    
-    Returns:
-        str: Complete Solidity contract source code
-    """
-    # Convert fee from percentage to basis points if needed
-    fee = market['fee']
-    if isinstance(fee, str) and fee.endswith('%'):
-        fee = int(fee.rstrip('%')) * 100
-    
-    # Generate the contract source
-    return f'''// SPDX-License-Identifier: MIT
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+
+# Solidity source for the generated market contract; braces are doubled for str.format
+_CONTRACT_TEMPLATE = '''// SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
 /// @title Binary Market Contract
@@ -63,7 +48,7 @@ contract BinaryMarket {{
         question = _question;
         oracle = _oracle;
         fee = _fee;
-        mechanism = "{market['mechanism']}";
+        mechanism = "{mechanism}";
         
         emit MarketCreated(_question, _oracle, _fee);
     }}
@@ -127,6 +112,53 @@ contract BinaryMarket {{
     }}
 }}'''
 
+def generate_contract(market: dict) -> str:
+    """Generate a Solidity contract from a market dictionary.
+    
+    Args:
+        market: Dictionary containing market details with keys:
+            - question: str
+            - oracle: str (Ethereum address)
+            - fee: int (basis points)
+            - outcomes: list[str]
+            - mechanism: str
+    
+    Returns:
+        str: Complete Solidity contract source code
+    """
+    # Convert fee from percentage to basis points if needed
+    fee = market['fee']
+    if isinstance(fee, str) and fee.endswith('%'):
+        fee = int(fee.rstrip('%')) * 100
+    
+    # Generate the contract source
+    return _render_contract(market['mechanism'])
+
+@lru_cache(maxsize=256)
+def _render_contract(mechanism: str) -> str:
+    """Render the contract template; cached since mechanism is the only substituted field."""
+    return _CONTRACT_TEMPLATE.format(mechanism=mechanism)
+
+def generate_contracts(markets: List[dict], out_dir: str) -> List[Path]:
+    """Generate and write one Solidity contract per market.
+    
+    Args:
+        markets: List of market dictionaries (see generate_contract)
+        out_dir: Directory to write Market1.sol, Market2.sol, ... into
+    
+    Returns:
+        list[Path]: Paths of the written contract files, in market order
+    """
+    # Render every source first so the write loop only does file I/O
+    sources = [generate_contract(market) for market in markets]
+    
+    paths = []
+    for i, source in enumerate(sources):
+        path = Path(out_dir) / f"Market{i + 1}.sol"
+        path.write_text(source)
+        paths.append(path)
+    return paths
+
 if __name__ == "__main__":
     # Example market from our DSL
     example_market = {
@@ -137,11 +169,7 @@ if __name__ == "__main__":
         "mechanism": "pool"
     }
     
-    # Generate the contract
-    contract_source = generate_contract(example_market)
-    
-    # Save to file
-    with open("contracts/Market1.sol", "w") as f:
-        f.write(contract_source)
+    # Generate the contract and save to file
+    paths = generate_contracts([example_market], "contracts")
     
-    print("Generated contract saved to contracts/Market1.sol") 
\ No newline at end of file
+    print(f"Generated contract saved to {paths[0]}") 
\ No newline at end of file